@@ -0,0 +1,3 @@
+"""Asynchronous Pure Python Meter-Bus (M-Bus EN13757-3) protocol implementation."""
+
+__version__ = "0.1.0"
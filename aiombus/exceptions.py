@@ -0,0 +1,13 @@
+"""The aiombus exception hierarchy."""
+
+
+class MBusError(Exception):
+    """The base M-Bus error."""
+
+
+class MBusValidationError(MBusError):
+    """Invalid value for an M-Bus entity."""
+
+
+class MBusDecodeError(MBusError):
+    """Failure to decode an M-Bus byte sequence."""
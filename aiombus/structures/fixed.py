@@ -0,0 +1,15 @@
+"""Legacy import path for the fixed data structure tables.
+
+The canonical definitions live in ``fixed_data_structure``;
+this module only re-exports them so both import sites share
+a single set of enum members.
+"""
+
+from aiombus.structures.fixed_data_structure import (
+    MeasuredMedium,
+    PhysicalUnits,
+    medium_of,
+    unit_of,
+)
+
+__all__ = ["MeasuredMedium", "PhysicalUnits", "medium_of", "unit_of"]
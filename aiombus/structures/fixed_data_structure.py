@@ -0,0 +1,116 @@
+"""Fixed data structure tables (EN 13757-3, Annex on fixed data).
+
+The measured medium nibble and the 6-bit physical unit field
+of the fixed data structure.
+"""
+
+from enum import IntEnum
+
+MEASURED_MEDIUM_MASK = 0b0000_1111
+PHYSICAL_UNITS_MASK = 0b0011_1111
+
+
+class MeasuredMedium(IntEnum):
+    """The measured medium nibble of the fixed data structure."""
+
+    other = 0x00
+    oil = 0x01
+    electricity = 0x02
+    gas = 0x03
+    heat = 0x04
+    steam = 0x05
+    hot_water = 0x06
+    water = 0x07
+    heat_cost_allocator = 0x08
+    compressed_air = 0x09
+    cooling_load_meter_outlet = 0x0A
+    cooling_load_meter_inlet = 0x0B
+    heat_inlet = 0x0C
+    heat_cooling_load_meter = 0x0D
+    bus_system = 0x0E
+    unknown = 0x0F
+
+
+class PhysicalUnits(IntEnum):
+    """The 6-bit physical unit and multiplier field."""
+
+    hour_minute_second = 0x00
+    day_month_year = 0x01
+    Wh = 0x02
+    Wh_times_10 = 0x03
+    Wh_times_100 = 0x04
+    kWh = 0x05
+    kWh_times_10 = 0x06
+    kWh_times_100 = 0x07
+    MWh = 0x08
+    MWh_times_10 = 0x09
+    MWh_times_100 = 0x0A
+    kJ = 0x0B
+    kJ_times_10 = 0x0C
+    kJ_times_100 = 0x0D
+    MJ = 0x0E
+    MJ_times_10 = 0x0F
+    MJ_times_100 = 0x10
+    GJ = 0x11
+    GJ_times_10 = 0x12
+    GJ_times_100 = 0x13
+    W = 0x14
+    W_times_10 = 0x15
+    W_times_100 = 0x16
+    kW = 0x17
+    kW_times_10 = 0x18
+    kW_times_100 = 0x19
+    MW = 0x1A
+    MW_times_10 = 0x1B
+    MW_times_100 = 0x1C
+    kJ_per_hour = 0x1D
+    kJ_per_hour_times_10 = 0x1E
+    kJ_per_hour_times_100 = 0x1F
+    MJ_per_hour = 0x20
+    MJ_per_hour_times_10 = 0x21
+    MJ_per_hour_times_100 = 0x22
+    GJ_per_hour = 0x23
+    GJ_per_hour_times_10 = 0x24
+    GJ_per_hour_times_100 = 0x25
+    ml = 0x26
+    ml_times_10 = 0x27
+    ml_times_100 = 0x28
+    litre = 0x29
+    litre_times_10 = 0x2A
+    litre_times_100 = 0x2B
+    cubic_metre = 0x2C
+    cubic_metre_times_10 = 0x2D
+    cubic_metre_times_100 = 0x2E
+    ml_per_hour = 0x2F
+    ml_per_hour_times_10 = 0x30
+    ml_per_hour_times_100 = 0x31
+    litre_per_hour = 0x32
+    litre_per_hour_times_10 = 0x33
+    litre_per_hour_times_100 = 0x34
+    cubic_metre_per_hour = 0x35
+    cubic_metre_per_hour_times_10 = 0x36
+    cubic_metre_per_hour_times_100 = 0x37
+    celsius_times_1e_minus_3 = 0x38
+    units_for_hca = 0x39
+    reserved_0x3a = 0x3A
+    reserved_0x3b = 0x3B
+    reserved_0x3c = 0x3C
+    reserved_0x3d = 0x3D
+    historic = 0x3E
+    without_units = 0x3F
+
+
+#: dense value-indexed views: member lookup by raw byte without
+#: going through EnumMeta.__call__ on the hot path.
+_MEDIA: tuple[MeasuredMedium, ...] = tuple(MeasuredMedium)
+_UNITS: tuple[PhysicalUnits, ...] = tuple(PhysicalUnits)
+
+
+def medium_of(byte: int) -> MeasuredMedium:
+    """Return the measured medium encoded in the low nibble of ``byte``."""
+    return _MEDIA[byte & MEASURED_MEDIUM_MASK]
+
+
+def unit_of(byte: int) -> PhysicalUnits:
+    """Return the physical unit encoded in the low 6 bits of ``byte``."""
+    return _UNITS[byte & PHYSICAL_UNITS_MASK]
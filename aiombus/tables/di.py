@@ -0,0 +1,71 @@
+"""Data information tables: DIF data field and function field codes.
+
+The IntEnum classes are the public, display-friendly representation.
+Hot parser paths should prefer the module-level integer constants
+below: comparing against a plain int skips EnumMeta.__call__ and
+keeps dispatch tables indexable by the raw nibble.
+"""
+
+from enum import IntEnum
+
+
+class DataFieldEnum(IntEnum):
+    """Length and coding of the record data (DIF bits 3-0)."""
+
+    no_data = 0b0000
+    int8 = 0b0001
+    int16 = 0b0010
+    int24 = 0b0011
+    int32 = 0b0100
+    real32 = 0b0101
+    int48 = 0b0110
+    int64 = 0b0111
+    readout = 0b1000
+    bcd2 = 0b1001
+    bcd4 = 0b1010
+    bcd6 = 0b1011
+    bcd8 = 0b1100
+    variable_length = 0b1101
+    bcd12 = 0b1110
+    special_functions = 0b1111
+
+
+#: the members indexed by the data nibble (all 16 values are
+#: defined, so iteration order covers the range); df_from_byte is the
+#: bound __getitem__, one C-level subscript with no Enum dispatch
+_BY_NIBBLE: tuple[DataFieldEnum, ...] = tuple(DataFieldEnum)
+
+df_from_byte = _BY_NIBBLE.__getitem__
+
+
+class FunctionFieldEnum(IntEnum):
+    """Type of the record value (DIF bits 5-4)."""
+
+    instantaneous = 0b00
+    maximum = 0b01
+    minimum = 0b10
+    error = 0b11
+
+
+# plain-int mirrors for hot-path dispatch and comparisons
+NO_DATA = 0b0000
+INT8 = 0b0001
+INT16 = 0b0010
+INT24 = 0b0011
+INT32 = 0b0100
+REAL32 = 0b0101
+INT48 = 0b0110
+INT64 = 0b0111
+READOUT = 0b1000
+BCD2 = 0b1001
+BCD4 = 0b1010
+BCD6 = 0b1011
+BCD8 = 0b1100
+VARIABLE_LENGTH = 0b1101
+BCD12 = 0b1110
+SPECIAL_FUNCTIONS = 0b1111
+
+INSTANTANEOUS = 0b00
+MAXIMUM = 0b01
+MINIMUM = 0b10
+ERROR = 0b11
@@ -0,0 +1,73 @@
+"""Base classes for M-Bus telegram entities."""
+
+from collections.abc import Iterable
+from typing import Self
+
+from aiombus.exceptions import MBusValidationError
+
+
+class TelegramField:
+    """A single-byte field of an M-Bus telegram."""
+
+    __slots__ = ("_byte",)
+
+    def __init__(self, byte: int, *, check_byte: bool = True) -> None:
+        # the validate_byte check inlined: one AND decides validity
+        # without a call per constructed field.
+        if check_byte and (byte.__class__ is not int or byte & ~0xFF):
+            msg = f"{byte!r} is not within the [0; 255] segment"
+            raise MBusValidationError(msg)
+        self._byte = byte
+
+    @property
+    def byte(self) -> int:
+        """The byte of the field."""
+        return self._byte
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(byte={self._byte})"
+
+    def __str__(self) -> str:
+        return f"{self._byte:#04x}"
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is int:
+            return self._byte == other
+        if isinstance(other, TelegramField):
+            return self._byte == other._byte
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return self._byte
+
+
+class TelegramBlock:
+    """A multi-byte block of an M-Bus telegram."""
+
+    @classmethod
+    def from_hexstring(cls, hex_: str) -> Self:
+        """Construct the block from a hexadecimal string."""
+        return cls(bytes.fromhex(hex_))
+
+    @classmethod
+    def from_integers(cls, ints: Iterable[int]) -> Self:
+        """Construct the block from an iterable of integers."""
+        return cls(bytes(ints))
+
+    @property
+    def bytes(self) -> bytes:
+        """The bytes of the block."""
+        return self._bytes
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(bytes={self._bytes!r})"
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, TelegramBlock):
+            return len(self._bytes) == len(other._bytes) and (
+                self._bytes == other._bytes
+            )
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self._bytes)
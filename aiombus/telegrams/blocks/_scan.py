@@ -0,0 +1,47 @@
+"""Buffer-level scan helpers for extension-bit terminated chains."""
+
+EXTENSION_BIT_MASK = 0b1000_0000
+
+_WORD_SIZE = 8
+_EXT_BITS_WORD = 0x8080_8080_8080_8080
+
+
+def scan_ext_chain(buf: bytes | bytearray | memoryview, start: int = 0) -> int:
+    """Return the index one past the end of an extension chain.
+
+    The chain starts at ``start`` and ends with the first byte
+    whose extension bit (bit 7) is clear; that terminator byte
+    is included in the chain.  If the buffer runs out before a
+    terminator is met, ``len(buf)`` is returned.
+
+    The scan is branchless SWAR over 8-byte words: each word is
+    masked against the packed extension bits and the lowest clear
+    one locates the terminator without a per-byte loop.
+    """
+    n = len(buf)
+    i = start
+    while i < n:
+        nbytes = min(_WORD_SIZE, n - i)
+        word = int.from_bytes(buf[i : i + nbytes], "little")
+        ext_bits = _EXT_BITS_WORD >> (_WORD_SIZE - nbytes) * 8
+        stop = ~word & ext_bits
+        if stop:
+            return i + (stop & -stop).bit_length() // 8
+        i += nbytes
+    return n
+
+
+def scan_ext_chains(buf: bytes | bytearray | memoryview, start: int = 0) -> list[int]:
+    """Return the end offsets of all consecutive extension chains.
+
+    Walks the whole buffer once and emits the offset one past each
+    chain terminator, so a telegram-level parser can place every
+    DIB/VIB boundary before constructing any wrapper objects.
+    """
+    offsets = []
+    i = start
+    n = len(buf)
+    while i < n:
+        i = scan_ext_chain(buf, i)
+        offsets.append(i)
+    return offsets
@@ -0,0 +1,91 @@
+"""Data Information Block (DIB).
+
+A DIB consists of one Data Information Field (DIF)
+and up to ten Data Information Field Extensions (DIFE).
+The chain is terminated by the first byte with a clear extension bit.
+"""
+
+from collections.abc import Iterator
+from typing import Self
+
+from aiombus.exceptions import MBusDecodeError, MBusValidationError
+from aiombus.telegrams.base import TelegramBlock, TelegramField
+from aiombus.telegrams.blocks._scan import scan_ext_chain
+from aiombus.telegrams.fields.data_info import (
+    DIF_POOL,
+    DIFE_POOL,
+    DataInformationField,
+    DataInformationFieldExtension,
+)
+
+
+class DataInformationBlock(TelegramBlock):
+    """The Data Information Block (DIB) class."""
+
+    MAX_DIFE_FRAMES = 10
+
+    def __init__(self, bytes_: bytes | bytearray | memoryview) -> None:
+        if not isinstance(bytes_, (bytes, bytearray, memoryview)):
+            msg = f"expected a byte buffer, got {type(bytes_).__name__}"
+            raise MBusValidationError(msg)
+        if not bytes_:
+            msg = "cannot parse a DIB from an empty byte sequence"
+            raise MBusDecodeError(msg)
+        # buffer elements are guaranteed to fit a byte,
+        # so the fields skip per-byte validation
+        self._bytes = bytes(bytes_)
+        self._dif = DIF_POOL[bytes_[0]]
+        self._dife_bytes = self._scan_dife_bytes(bytes_, self._dif)
+        self._difes: tuple[DataInformationFieldExtension, ...] | None = None
+        self._fields: tuple[TelegramField, ...] | None = None
+
+    @classmethod
+    def consume(
+        cls, buf: bytes | bytearray | memoryview, start: int = 0
+    ) -> tuple[Self, int]:
+        """Parse one block from ``buf`` at ``start``, returning it with the end offset.
+
+        The chain end is located with a single :func:`scan_ext_chain`
+        pass and the block is built from a zero-copy ``memoryview``
+        slice, so a cursor-style parser can walk a telegram buffer
+        without materializing an intermediate buffer per block.
+        """
+        end = scan_ext_chain(buf, start)
+        return cls(memoryview(buf)[start:end]), end
+
+    @property
+    def dif(self) -> DataInformationField:
+        """The DIF of the block."""
+        return self._dif
+
+    @property
+    def difes(self) -> tuple[DataInformationFieldExtension, ...]:
+        """The DIFEs of the block (materialized on first access)."""
+        difes = self._difes
+        if difes is None:
+            difes = tuple(DIFE_POOL[byte] for byte in self._dife_bytes)
+            self._difes = difes
+        return difes
+
+    def __iter__(self) -> Iterator[TelegramField]:
+        # the field tuple is cached so repeated passes iterate a
+        # ready sequence instead of re-running a generator
+        fields = self._fields
+        if fields is None:
+            fields = (self._dif, *self.difes)
+            self._fields = fields
+        return iter(fields)
+
+    def __str__(self) -> str:
+        return str([str(field) for field in self])
+
+    def _scan_dife_bytes(
+        self, bytes_: bytes | bytearray | memoryview, dif: DataInformationField
+    ) -> bytes:
+        if not dif.extension_bit:
+            return b""
+        end = scan_ext_chain(bytes_, 1)
+        if end - 1 > self.MAX_DIFE_FRAMES:
+            msg = f"the number of DIFE frames exceeds {self.MAX_DIFE_FRAMES}"
+            raise MBusDecodeError(msg)
+        return bytes(bytes_[1:end])
@@ -0,0 +1,55 @@
+"""Data Record Header (DRH).
+
+A DRH opens an M-Bus data record: a Data Information Block (DIB),
+a Value Information Block (VIB) and the data bytes they describe.
+"""
+
+from aiombus.telegrams.blocks._scan import scan_ext_chain
+from aiombus.telegrams.blocks.dib import DataInformationBlock
+from aiombus.telegrams.blocks.vib import ValueInformationBlock
+
+
+def split_drh(buf: bytes | bytearray | memoryview) -> tuple[int, int]:
+    """Split a record frame into its DIB, VIB and data regions.
+
+    Returns ``(dib_end, vib_end)`` such that ``buf[:dib_end]`` is the
+    DIB, ``buf[dib_end:vib_end]`` the VIB and ``buf[vib_end:]`` the
+    data — found in one linear scan with no intermediate objects.
+    """
+    dib_end = scan_ext_chain(buf, 0)
+    vib_end = scan_ext_chain(buf, dib_end)
+    return dib_end, vib_end
+
+
+class DataRecordHeader:
+    """The Data Record Header (DRH) class."""
+
+    __slots__ = ("_dib", "_vib", "_data")
+
+    def __init__(self, frame: bytes | bytearray | memoryview) -> None:
+        mv = memoryview(frame)
+        dib_end, vib_end = split_drh(mv)
+        self._dib = DataInformationBlock(mv[:dib_end])
+        self._vib = ValueInformationBlock(mv[dib_end:vib_end])
+        self._data = bytes(mv[vib_end:])
+
+    @property
+    def dib(self) -> DataInformationBlock:
+        """The DIB of the record."""
+        return self._dib
+
+    @property
+    def vib(self) -> ValueInformationBlock:
+        """The VIB of the record."""
+        return self._vib
+
+    @property
+    def data(self) -> bytes:
+        """The data bytes of the record."""
+        return self._data
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}"
+            f"(dib={self._dib!r}, vib={self._vib!r}, data={self._data!r})"
+        )
@@ -0,0 +1,81 @@
+"""Value Information Block (VIB).
+
+A VIB consists of one Value Information Field (VIF)
+and up to ten Value Information Field Extensions (VIFE).
+The chain is terminated by the first byte with a clear extension bit.
+"""
+
+from collections.abc import Iterator
+from typing import Self
+
+from aiombus.exceptions import MBusDecodeError, MBusValidationError
+from aiombus.telegrams.base import TelegramBlock, TelegramField
+from aiombus.telegrams.blocks._scan import scan_ext_chain
+from aiombus.telegrams.fields.value_info import (
+    ValueInformationField,
+    ValueInformationFieldExtension,
+)
+
+
+class ValueInformationBlock(TelegramBlock):
+    """The Value Information Block (VIB) class."""
+
+    MAX_VIFE_FRAMES = 10
+
+    def __init__(self, bytes_: bytes | bytearray | memoryview) -> None:
+        if not isinstance(bytes_, (bytes, bytearray, memoryview)):
+            msg = f"expected a byte buffer, got {type(bytes_).__name__}"
+            raise MBusValidationError(msg)
+        if not bytes_:
+            msg = "cannot parse a VIB from an empty byte sequence"
+            raise MBusDecodeError(msg)
+        # buffer elements are guaranteed to fit a byte,
+        # so the fields skip per-byte validation
+        self._bytes = bytes(bytes_)
+        self._vif = ValueInformationField(bytes_[0], check_byte=False)
+        self._vifes = self._parse_vife_blocks(bytes_)
+
+    @classmethod
+    def consume(
+        cls, buf: bytes | bytearray | memoryview, start: int = 0
+    ) -> tuple[Self, int]:
+        """Parse one block from ``buf`` at ``start``, returning it with the end offset.
+
+        The chain end is located with a single :func:`scan_ext_chain`
+        pass and the block is built from a zero-copy ``memoryview``
+        slice, so a cursor-style parser can walk a telegram buffer
+        without materializing an intermediate buffer per block.
+        """
+        end = scan_ext_chain(buf, start)
+        return cls(memoryview(buf)[start:end]), end
+
+    @property
+    def vif(self) -> ValueInformationField:
+        """The VIF of the block."""
+        return self._vif
+
+    @property
+    def vifes(self) -> tuple[ValueInformationFieldExtension, ...]:
+        """The VIFEs of the block."""
+        return self._vifes
+
+    def __iter__(self) -> Iterator[TelegramField]:
+        yield self._vif
+        yield from self._vifes
+
+    def __str__(self) -> str:
+        return str([str(field) for field in self])
+
+    def _parse_vife_blocks(
+        self, bytes_: bytes | bytearray | memoryview
+    ) -> tuple[ValueInformationFieldExtension, ...]:
+        if not self._vif.extension_bit:
+            return ()
+        end = scan_ext_chain(bytes_, 1)
+        if end - 1 > self.MAX_VIFE_FRAMES:
+            msg = f"the number of VIFE frames exceeds {self.MAX_VIFE_FRAMES}"
+            raise MBusDecodeError(msg)
+        return tuple(
+            ValueInformationFieldExtension(byte, check_byte=False)
+            for byte in bytes_[1:end]
+        )
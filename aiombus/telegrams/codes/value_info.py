@@ -0,0 +1,226 @@
+"""Primary Value Information Field (VIF) codes (EN 13757-3).
+
+Each code class covers one row of the primary VIF table:
+``CMASK`` is the fixed code part of the byte, ``EMASK`` masks the
+variable part (multiplier power or time unit) and ``UNIT`` names
+the physical unit of the value the VIF describes.
+"""
+
+from aiombus.exceptions import MBusError
+from aiombus.telegrams.fields.value_info import ValueInformationField
+
+VIF_DATA_MASK = 0b0111_1111
+
+#: decimal multipliers 10^-6 .. 10^7 shared by all code classes;
+#: index with the power plus _POW10_OFFSET instead of calling pow
+#: on every construction.
+_POW10_OFFSET = 6
+_POW10 = tuple(10.0**i for i in range(-_POW10_OFFSET, 8))
+
+#: time units of the On time / Operating time codes, indexed by
+#: the two low bits of the VIF byte.
+_TIME_UNITS = ("second", "minute", "hour", "day")
+
+
+class ValueInformationFieldCode:
+    """The base class of the primary VIF table rows."""
+
+    __slots__ = ("_vif",)
+
+    CMASK: int
+    EMASK: int
+    UNIT: str | None = None
+
+    def __init__(self, vif: ValueInformationField) -> None:
+        self.check_coding(vif)
+        self._vif = vif
+
+    @classmethod
+    def matches(cls, byte: int) -> bool:
+        """Whether the VIF byte carries this code (no exceptions)."""
+        return (byte & ~cls.EMASK) & VIF_DATA_MASK == cls.CMASK
+
+    def check_coding(self, vif: ValueInformationField) -> None:
+        """Raise `MBusError` if ``vif`` does not carry this code."""
+        byte = vif.byte & VIF_DATA_MASK
+        if not self.matches(byte):
+            msg = f"the byte {byte:#04x} does not fit the code {self.CMASK:#04x}"
+            raise MBusError(msg)
+
+    @property
+    def vif(self) -> ValueInformationField:
+        """The VIF the code was parsed from."""
+        return self._vif
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(vif={self._vif!r})"
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, ValueInformationFieldCode):
+            return type(self) is type(other) and self._vif == other._vif
+        return NotImplemented
+
+
+class EnergyWattHourVIFCode(ValueInformationFieldCode):
+    """Energy in Wh, E000 0nnn, multiplier 10^(nnn-3)."""
+
+    __slots__ = ("_multiplier",)
+
+    CMASK = 0b0000_0000
+    EMASK = 0b0000_0111
+    UNIT = "Wh"
+
+    def __init__(self, vif: ValueInformationField) -> None:
+        super().__init__(vif)
+        pwr = vif.byte & self.EMASK
+        self._multiplier = _POW10[pwr - 3 + _POW10_OFFSET]
+
+    @property
+    def multiplier(self) -> float:
+        """The decimal multiplier of the value."""
+        return self._multiplier
+
+
+class EnergyJouleVIFCode(ValueInformationFieldCode):
+    """Energy in J, E000 1nnn, multiplier 10^nnn."""
+
+    __slots__ = ("_multiplier",)
+
+    CMASK = 0b0000_1000
+    EMASK = 0b0000_0111
+    UNIT = "J"
+
+    def __init__(self, vif: ValueInformationField) -> None:
+        super().__init__(vif)
+        pwr = vif.byte & self.EMASK
+        self._multiplier = _POW10[pwr + _POW10_OFFSET]
+
+    @property
+    def multiplier(self) -> float:
+        """The decimal multiplier of the value."""
+        return self._multiplier
+
+
+class VolumeMeterCubeVIFCode(ValueInformationFieldCode):
+    """Volume in m^3, E001 0nnn, multiplier 10^(nnn-6)."""
+
+    __slots__ = ("_multiplier",)
+
+    CMASK = 0b0001_0000
+    EMASK = 0b0000_0111
+    UNIT = "m^3"
+
+    def __init__(self, vif: ValueInformationField) -> None:
+        super().__init__(vif)
+        pwr = vif.byte & self.EMASK
+        self._multiplier = _POW10[pwr - 6 + _POW10_OFFSET]
+
+    @property
+    def multiplier(self) -> float:
+        """The decimal multiplier of the value."""
+        return self._multiplier
+
+
+class VolumeMassKilogramVIFCode(ValueInformationFieldCode):
+    """Mass in kg, E001 1nnn, multiplier 10^(nnn-3)."""
+
+    __slots__ = ("_multiplier",)
+
+    CMASK = 0b0001_1000
+    EMASK = 0b0000_0111
+    UNIT = "kg"
+
+    def __init__(self, vif: ValueInformationField) -> None:
+        super().__init__(vif)
+        pwr = vif.byte & self.EMASK
+        self._multiplier = _POW10[pwr - 3 + _POW10_OFFSET]
+
+    @property
+    def multiplier(self) -> float:
+        """The decimal multiplier of the value."""
+        return self._multiplier
+
+
+class OnTimeVIFCode(ValueInformationFieldCode):
+    """On time, E010 00nn, the unit is coded by the two low bits."""
+
+    __slots__ = ("UNIT",)
+
+    CMASK = 0b0010_0000
+    EMASK = 0b0000_0011
+
+    def __init__(self, vif: ValueInformationField) -> None:
+        super().__init__(vif)
+        self.UNIT = _TIME_UNITS[vif.byte & self.EMASK]
+
+
+class OperatingTimeVIFCode(ValueInformationFieldCode):
+    """Operating time, E010 01nn, the unit is coded by the two low bits."""
+
+    __slots__ = ("UNIT",)
+
+    CMASK = 0b0010_0100
+    EMASK = 0b0000_0011
+
+    def __init__(self, vif: ValueInformationField) -> None:
+        super().__init__(vif)
+        self.UNIT = _TIME_UNITS[vif.byte & self.EMASK]
+
+
+class PowerWattVIFCode(ValueInformationFieldCode):
+    """Power in W, E010 1nnn, multiplier 10^(nnn-3)."""
+
+    __slots__ = ("_multiplier",)
+
+    CMASK = 0b0010_1000
+    EMASK = 0b0000_0111
+    UNIT = "W"
+
+    def __init__(self, vif: ValueInformationField) -> None:
+        super().__init__(vif)
+        pwr = vif.byte & self.EMASK
+        self._multiplier = _POW10[pwr - 3 + _POW10_OFFSET]
+
+    @property
+    def multiplier(self) -> float:
+        """The decimal multiplier of the value."""
+        return self._multiplier
+
+
+#: ordered by the match frequency seen in real telegrams so a
+#: linear probe returns early on the common codes.
+VIF_CODE_TYPES: tuple[type[ValueInformationFieldCode], ...] = (
+    EnergyWattHourVIFCode,
+    PowerWattVIFCode,
+    VolumeMeterCubeVIFCode,
+    VolumeMassKilogramVIFCode,
+    EnergyJouleVIFCode,
+    OnTimeVIFCode,
+    OperatingTimeVIFCode,
+)
+
+#: direct dispatch: the masked VIF byte resolves its code class
+#: (or None) with one indexed load instead of an O(N) try chain.
+#: matches() keeps the build free of exception control flow.
+_VIF_DISPATCH: list[type[ValueInformationFieldCode] | None] = [
+    next((cls for cls in VIF_CODE_TYPES if cls.matches(byte)), None)
+    for byte in range(128)
+]
+
+
+def _build_vif_code(byte: int) -> ValueInformationFieldCode | None:
+    cls = _VIF_DISPATCH[byte]
+    return None if cls is None else cls(ValueInformationField(byte))
+
+
+#: every legal code prebuilt at import time: a code is a pure
+#: function of the 7 data bits, so the 128 shared instances cover
+#: all decodes.  Treat them as immutable.
+_VIF_TABLE: tuple[ValueInformationFieldCode | None, ...] = tuple(
+    _build_vif_code(byte) for byte in range(128)
+)
+
+
+def get_vif_code(vif: ValueInformationField) -> ValueInformationFieldCode | None:
+    """Return the VIF code of ``vif`` or None if it is not covered."""
+    return _VIF_TABLE[vif.byte & VIF_DATA_MASK]
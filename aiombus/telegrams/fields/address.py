@@ -0,0 +1,92 @@
+"""Address (A) field of an M-Bus telegram.
+
+Primary addressing (EN 13757-2): 0 marks an unconfigured slave,
+1..250 are configured slaves, 253 routes to the network layer,
+254 broadcasts with all slaves replying, 255 broadcasts silently.
+"""
+
+from aiombus.telegrams.base import TelegramField
+
+UNCONFIGURED_SLAVE_BYTE = 0
+NETWORK_LAYER_BYTE = 253
+BROADCAST_ALL_REPLY_BYTE = 254
+BROADCAST_NO_REPLIES_BYTE = 255
+
+_UNCONFIGURED = 0b0000_0001
+_CONFIGURED = 0b0000_0010
+_BROADCAST_ALL = 0b0000_0100
+_BROADCAST_NONE = 0b0000_1000
+_NETWORK = 0b0001_0000
+
+_SLAVE = _UNCONFIGURED | _CONFIGURED
+_BROADCAST = _BROADCAST_ALL | _BROADCAST_NONE
+
+
+def _classify(byte: int) -> int:
+    if byte == UNCONFIGURED_SLAVE_BYTE:
+        return _UNCONFIGURED
+    if 1 <= byte <= 250:
+        return _CONFIGURED
+    if byte == NETWORK_LAYER_BYTE:
+        return _NETWORK
+    if byte == BROADCAST_ALL_REPLY_BYTE:
+        return _BROADCAST_ALL
+    if byte == BROADCAST_NO_REPLIES_BYTE:
+        return _BROADCAST_NONE
+    return 0
+
+
+#: one category byte per address value, built once at import;
+#: every predicate is a single mask on the cached category.
+_CATEGORY = bytes(_classify(byte) for byte in range(256))
+
+
+class AddressField(TelegramField):
+    """The Address (A) field class."""
+
+    __slots__ = ("_cat",)
+
+    def __init__(self, byte: int, *, check_byte: bool = True) -> None:
+        super().__init__(byte, check_byte=check_byte)
+        self._cat = _CATEGORY[self._byte]
+
+    @property
+    def is_unconfigured_slave(self) -> bool:
+        """Whether the address marks a not yet configured slave."""
+        return bool(self._cat & _UNCONFIGURED)
+
+    @property
+    def is_configured_slave(self) -> bool:
+        """Whether the address points to a configured slave."""
+        return bool(self._cat & _CONFIGURED)
+
+    @property
+    def is_slave(self) -> bool:
+        """Whether the address points to a slave at all."""
+        return bool(self._cat & _SLAVE)
+
+    @property
+    def is_broadcast_all_reply(self) -> bool:
+        """Whether the address broadcasts with all slaves replying."""
+        return bool(self._cat & _BROADCAST_ALL)
+
+    @property
+    def is_broadcast_no_replies(self) -> bool:
+        """Whether the address broadcasts with nobody replying."""
+        return bool(self._cat & _BROADCAST_NONE)
+
+    @property
+    def is_broadcast(self) -> bool:
+        """Whether the address is a broadcast one."""
+        return bool(self._cat & _BROADCAST)
+
+    @property
+    def is_network_layer(self) -> bool:
+        """Whether the address routes to the network layer."""
+        return bool(self._cat & _NETWORK)
+
+
+#: flyweight pool shared by all parsed frames (see DIF_POOL).
+ADDRESS_FIELD_POOL: tuple[AddressField, ...] = tuple(
+    AddressField(byte, check_byte=False) for byte in range(256)
+)
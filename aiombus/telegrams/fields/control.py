@@ -0,0 +1,79 @@
+"""Control (C) field of an M-Bus telegram.
+
+The C field byte layout (EN 13757-2):
+
++----------+-----------+-----------+-----------+---------------+
+| bit 7    | bit 6     | bit 5     | bit 4     | bits 3-0      |
++----------+-----------+-----------+-----------+---------------+
+| reserved | PRM       | FCB / ACD | FCV / DFC | function code |
++----------+-----------+-----------+-----------+---------------+
+
+PRM set means the calling direction (master to slave); bits 5-4
+are FCB/FCV in that direction and ACD/DFC in the reply direction.
+"""
+
+from aiombus.telegrams.base import TelegramField
+
+RSP_UD_FUNCTION_CODE = 0x08
+
+_CALLING = 0b0000_0001
+_REPLY = 0b0000_0010
+_FCB = 0b0000_0100
+_FCV = 0b0000_1000
+
+
+def _classify(byte: int) -> int:
+    prm = (byte >> 6) & 1
+    fcb = (byte >> 5) & 1
+    fcv = (byte >> 4) & 1
+    func = byte & 0x0F
+    cat = (prm * _CALLING) | (fcb * _FCB) | (fcv * _FCV) | (func << 4)
+    if not prm and func == RSP_UD_FUNCTION_CODE:
+        cat |= _REPLY
+    return cat
+
+
+#: one packed category byte per control byte value, built once at
+#: import; every accessor is a mask or shift on the cached category.
+_CATEGORY = bytes(_classify(byte) for byte in range(256))
+
+
+class ControlField(TelegramField):
+    """The Control (C) field class."""
+
+    __slots__ = ("_cat",)
+
+    def __init__(self, byte: int, *, check_byte: bool = True) -> None:
+        super().__init__(byte, check_byte=check_byte)
+        self._cat = _CATEGORY[self._byte]
+
+    @property
+    def function_code(self) -> int:
+        """The function code (low nibble) of the field."""
+        return self._cat >> 4
+
+    @property
+    def is_calling_direction(self) -> bool:
+        """Whether the frame travels from the master to a slave."""
+        return bool(self._cat & _CALLING)
+
+    @property
+    def is_reply(self) -> bool:
+        """Whether the frame is a slave RSP_UD reply."""
+        return bool(self._cat & _REPLY)
+
+    @property
+    def fcb(self) -> int:
+        """The frame count bit (ACD in the reply direction)."""
+        return (self._cat & _FCB) >> 2
+
+    @property
+    def fcv(self) -> int:
+        """The frame count valid bit (DFC in the reply direction)."""
+        return (self._cat & _FCV) >> 3
+
+
+#: flyweight pool shared by all parsed frames (see DIF_POOL).
+CONTROL_FIELD_POOL: tuple[ControlField, ...] = tuple(
+    ControlField(byte, check_byte=False) for byte in range(256)
+)
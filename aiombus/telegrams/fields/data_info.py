@@ -0,0 +1,190 @@
+"""Data Information Field (DIF) and its extension (DIFE).
+
+The DIF byte layout (EN 13757-3):
+
++-----------+--------------------+----------------+------------+
+| bit 7     | bit 6              | bits 5-4       | bits 3-0   |
++-----------+--------------------+----------------+------------+
+| extension | storage number LSB | function field | data field |
++-----------+--------------------+----------------+------------+
+
+The DIFE byte layout:
+
++-----------+-------------+----------+----------------+
+| bit 7     | bit 6       | bits 5-4 | bits 3-0       |
++-----------+-------------+----------+----------------+
+| extension | device unit | tariff   | storage number |
++-----------+-------------+----------+----------------+
+"""
+
+from aiombus.telegrams.base import TelegramField
+
+#: the shared DIF/DIFE byte layout masks as module-level constants;
+#: the class attributes below alias them for the public API, while
+#: the hot decode path reads neither and goes through the table.
+EXTENSION_BIT_MASK = 0b1000_0000
+STORAGE_NUMBER_LSB_MASK = 0b0100_0000
+FUNCTION_FIELD_MASK = 0b0011_0000
+DATA_FIELD_MASK = 0b0000_1111
+DEVICE_UNIT_MASK = 0b0100_0000
+TARIFF_MASK = 0b0011_0000
+STORAGE_NUMBER_MASK = 0b0000_1111
+
+#: decoded (bits 3-0, bits 5-4, bit 6, bit 7) per byte value.
+#: DIF and DIFE share the byte layout, so one table serves both.
+_SUBFIELD_TABLE = tuple(
+    (b & 0x0F, (b >> 4) & 0b11, (b >> 6) & 1, b >> 7) for b in range(256)
+)
+
+
+def unpack_difs(buf: bytes | bytearray) -> tuple[tuple[int, ...], ...]:
+    """Unpack the four DIF subfields of each byte in ``buf`` in one sweep.
+
+    Returns four equally sized tuples:
+    ``(data_fields, function_fields, storage_number_lsbs, extension_bits)``.
+
+    The helper avoids constructing one `DataInformationField` per byte
+    when only the raw subfield values of a whole chain are needed.
+    """
+    data = tuple(b & 0x0F for b in buf)
+    func = tuple((b >> 4) & 0b11 for b in buf)
+    sn_lsb = tuple((b >> 6) & 1 for b in buf)
+    ext = tuple(b >> 7 for b in buf)
+    return data, func, sn_lsb, ext
+
+
+class DataInformationField(TelegramField):
+    """The Data Information Field (DIF) class."""
+
+    __slots__ = ("_data", "_func", "_sn_lsb", "_ext")
+
+    EXTENSION_BIT_MASK = EXTENSION_BIT_MASK
+    STORAGE_NUMBER_LSB_MASK = STORAGE_NUMBER_LSB_MASK
+    FUNCTION_FIELD_MASK = FUNCTION_FIELD_MASK
+    DATA_FIELD_MASK = DATA_FIELD_MASK
+
+    #: rebound to the flyweight pool once it is built below, after
+    #: which the constructor interns: DIF(b) is DIF_POOL[b]
+    _pool: tuple["DataInformationField", ...] = ()
+
+    def __new__(cls, byte: int, *, check_byte: bool = True) -> "DataInformationField":
+        pool = cls._pool
+        if pool and byte.__class__ is int and not byte & ~0xFF:
+            return pool[byte]
+        return super().__new__(cls)
+
+    def __init__(self, byte: int, *, check_byte: bool = True) -> None:
+        super().__init__(byte, check_byte=check_byte)
+
+        self._data, self._func, self._sn_lsb, self._ext = _SUBFIELD_TABLE[byte]
+
+    @property
+    def extension_bit(self) -> int:
+        """The extension bit of the field."""
+        return self._ext
+
+    @property
+    def storage_number_lsb(self) -> int:
+        """The least significant bit of the storage number."""
+        return self._sn_lsb
+
+    @property
+    def function_field(self) -> int:
+        """The function field of the data."""
+        return self._func
+
+    @property
+    def data_field(self) -> int:
+        """The data field: length and coding of the data."""
+        return self._data
+
+    @property
+    def encoding_byte(self) -> int:
+        """The low nibble of the field, shared with DIFE.
+
+        One polymorphic accessor for parsers that walk a mixed
+        DIF/DIFE chain, instead of an isinstance branch per field.
+        """
+        return self._data
+
+    @classmethod
+    def decode_many(cls, buf: bytes | bytearray) -> tuple["DataInformationField", ...]:
+        """Decode a stream of DIF bytes into pooled field instances.
+
+        The subfields were already split per byte when the pool was
+        built, so a batch decode is a plain table gather with no
+        shifting, masking or allocation per byte.
+        """
+        return tuple(map(DIF_POOL.__getitem__, buf))
+
+
+class DataInformationFieldExtension(TelegramField):
+    """The Data Information Field Extension (DIFE) class."""
+
+    __slots__ = ("_storage_number", "_tariff", "_device_unit", "_ext")
+
+    EXTENSION_BIT_MASK = EXTENSION_BIT_MASK
+    DEVICE_UNIT_MASK = DEVICE_UNIT_MASK
+    TARIFF_MASK = TARIFF_MASK
+    STORAGE_NUMBER_MASK = STORAGE_NUMBER_MASK
+
+    _pool: tuple["DataInformationFieldExtension", ...] = ()
+
+    def __new__(
+        cls, byte: int, *, check_byte: bool = True
+    ) -> "DataInformationFieldExtension":
+        pool = cls._pool
+        if pool and byte.__class__ is int and not byte & ~0xFF:
+            return pool[byte]
+        return super().__new__(cls)
+
+    def __init__(self, byte: int, *, check_byte: bool = True) -> None:
+        super().__init__(byte, check_byte=check_byte)
+
+        self._storage_number, self._tariff, self._device_unit, self._ext = (
+            _SUBFIELD_TABLE[byte]
+        )
+
+    @property
+    def extension_bit(self) -> int:
+        """The extension bit of the field."""
+        return self._ext
+
+    @property
+    def device_unit(self) -> int:
+        """The device unit bit of the storage number."""
+        return self._device_unit
+
+    @property
+    def tariff(self) -> int:
+        """The tariff part of the storage number."""
+        return self._tariff
+
+    @property
+    def storage_number(self) -> int:
+        """The storage number part of the field."""
+        return self._storage_number
+
+    @property
+    def encoding_byte(self) -> int:
+        """The low nibble of the field, shared with DIF.
+
+        One polymorphic accessor for parsers that walk a mixed
+        DIF/DIFE chain, instead of an isinstance branch per field.
+        """
+        return self._storage_number
+
+
+#: flyweight pools: a field is fully determined by its byte, and the
+#: instances are immutable, so the 256 possible values of each class
+#: are shared instead of re-allocated on every parsed block.
+DIF_POOL: tuple[DataInformationField, ...] = tuple(
+    DataInformationField(byte, check_byte=False) for byte in range(256)
+)
+DIFE_POOL: tuple[DataInformationFieldExtension, ...] = tuple(
+    DataInformationFieldExtension(byte, check_byte=False) for byte in range(256)
+)
+
+# from here on the constructors intern through the pools
+DataInformationField._pool = DIF_POOL
+DataInformationFieldExtension._pool = DIFE_POOL
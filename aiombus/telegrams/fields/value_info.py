@@ -0,0 +1,70 @@
+"""Value Information Field (VIF) and its extension (VIFE).
+
+Both share the byte layout (EN 13757-3):
+
++-----------+----------------------------------+
+| bit 7     | bits 6-0                         |
++-----------+----------------------------------+
+| extension | unit and multiplier (value data) |
++-----------+----------------------------------+
+"""
+
+from aiombus.telegrams.base import TelegramField
+
+
+class ValueInformationField(TelegramField):
+    """The Value Information Field (VIF) class."""
+
+    __slots__ = ("_data", "_ext")
+
+    EXTENSION_BIT_MASK = 0b1000_0000
+    DATA_MASK = 0b0111_1111
+
+    #: rebound to the flyweight pool once it is built below, after
+    #: which the constructor interns: VIF(b) is VIF_POOL[b]
+    _pool: tuple["ValueInformationField", ...] = ()
+
+    def __new__(cls, byte: int, *, check_byte: bool = True) -> "ValueInformationField":
+        pool = cls._pool
+        if pool and byte.__class__ is int and not byte & ~0xFF:
+            return pool[byte]
+        return super().__new__(cls)
+
+    def __init__(self, byte: int, *, check_byte: bool = True) -> None:
+        super().__init__(byte, check_byte=check_byte)
+
+        self._ext = byte >> 7
+        self._data = byte & self.DATA_MASK
+
+    @property
+    def extension_bit(self) -> int:
+        """The extension bit of the field."""
+        return self._ext
+
+    @property
+    def data(self) -> int:
+        """The unit and multiplier part of the field."""
+        return self._data
+
+
+class ValueInformationFieldExtension(ValueInformationField):
+    """The Value Information Field Extension (VIFE) class."""
+
+    __slots__ = ()
+
+    _pool: tuple["ValueInformationFieldExtension", ...] = ()
+
+
+#: flyweight pools: a field is fully determined by its byte, and the
+#: instances are immutable, so the 256 possible values of each class
+#: are shared instead of re-allocated on every parsed block.
+VIF_POOL: tuple[ValueInformationField, ...] = tuple(
+    ValueInformationField(byte, check_byte=False) for byte in range(256)
+)
+VIFE_POOL: tuple[ValueInformationFieldExtension, ...] = tuple(
+    ValueInformationFieldExtension(byte, check_byte=False) for byte in range(256)
+)
+
+# from here on the constructors intern through the pools
+ValueInformationField._pool = VIF_POOL
+ValueInformationFieldExtension._pool = VIFE_POOL
@@ -0,0 +1,120 @@
+"""M-Bus telegram frames (EN 13757-2).
+
+A single frame is the one-byte acknowledgement (0xE5).
+A short frame is 5 bytes: start (0x10), C field, A field,
+checksum and stop (0x16).
+"""
+
+from collections.abc import Iterator
+from functools import cached_property
+from typing import Self
+
+from aiombus.exceptions import MBusDecodeError
+from aiombus.telegrams.fields.address import ADDRESS_FIELD_POOL, AddressField
+from aiombus.telegrams.fields.control import CONTROL_FIELD_POOL, ControlField
+
+ACK_BYTE = 0xE5
+SHORT_FRAME_START_BYTE = 0x10
+LONG_FRAME_START_BYTE = 0x68
+FRAME_STOP_BYTE = 0x16
+
+SHORT_FRAME_LENGTH = 5
+
+
+def _checksum(buf: bytes | bytearray | memoryview) -> int:
+    """The M-Bus checksum: the sum of the user bytes modulo 256.
+
+    ``sum`` over a buffer runs as a single native loop, so no
+    per-byte Python accumulation happens even for long frames.
+    """
+    return sum(buf) & 0xFF
+
+
+class TelegramFrame:
+    """The base class of M-Bus telegram frames.
+
+    Frames keep their payload as one contiguous ``bytes`` object
+    instead of a ``Field`` per byte; field objects are built lazily
+    by the accessors that need them.
+    """
+
+    def __init__(self, frame: bytes) -> None:
+        self._frame = frame
+
+    @property
+    def bytes(self) -> bytes:
+        """The raw bytes of the frame."""
+        return self._frame
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(self._frame)
+
+    def __str__(self) -> str:
+        return self._frame.hex(" ")
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, TelegramFrame):
+            return self._frame == other._frame
+        return NotImplemented
+
+
+class SingleFrame(TelegramFrame):
+    """The single character (acknowledgement) frame."""
+
+    def __init__(self, byte: int = ACK_BYTE) -> None:
+        if byte != ACK_BYTE:
+            msg = f"a single frame must be {ACK_BYTE:#04x}, got {byte:#04x}"
+            raise MBusDecodeError(msg)
+        super().__init__(b"\xe5")
+
+
+def decode_short_frame(buf: bytes | bytearray | memoryview) -> tuple[int, int, int]:
+    """Validate a short frame buffer and return ``(c, a, checksum)``.
+
+    Offsets-and-ints only, no object construction: the narrow seam a
+    compiled decoder could replace (see the performance notes in the
+    README).
+    """
+    if len(buf) != SHORT_FRAME_LENGTH:
+        msg = f"a short frame must be {SHORT_FRAME_LENGTH} bytes, got {len(buf)}"
+        raise MBusDecodeError(msg)
+    if buf[0] != SHORT_FRAME_START_BYTE or buf[4] != FRAME_STOP_BYTE:
+        msg = "invalid short frame start/stop bytes"
+        raise MBusDecodeError(msg)
+    return buf[1], buf[2], buf[3]
+
+
+class ShortFrame(TelegramFrame):
+    """The short (5 byte) frame."""
+
+    def __init__(self, data: bytes | bytearray | memoryview | list[int]) -> None:
+        if not isinstance(data, (bytes, bytearray, memoryview)):
+            data = bytes(data)
+        # validate on the view before materializing the copy so a
+        # malformed buffer is rejected without any allocation.
+        c, a, check_sum = decode_short_frame(data)
+        expected = (c + a) & 0xFF
+        if check_sum != expected:
+            msg = f"invalid short frame checksum {check_sum:#04x}, expected {expected:#04x}"
+            raise MBusDecodeError(msg)
+        super().__init__(bytes(data))
+
+    @classmethod
+    def from_bytes(cls, buf: bytes | bytearray | memoryview) -> Self:
+        """Construct the frame from an already materialized buffer."""
+        return cls(buf)
+
+    @cached_property
+    def control_field(self) -> ControlField:
+        """The C field of the frame."""
+        return CONTROL_FIELD_POOL[self._frame[1]]
+
+    @cached_property
+    def address_field(self) -> AddressField:
+        """The A field of the frame."""
+        return ADDRESS_FIELD_POOL[self._frame[2]]
+
+    @property
+    def check_sum(self) -> int:
+        """The checksum byte of the frame."""
+        return self._frame[3]
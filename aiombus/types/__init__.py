@@ -0,0 +1,53 @@
+"""M-Bus data types.
+
+The ``aiombus.types`` package is the single home of the type
+decoders: the datetime and integer code lives in its submodules
+and is re-exported here so both import sites share one
+implementation (and any hot-path optimization lands once).
+"""
+
+from aiombus.types.datetimes import (
+    Date,
+    DateTime,
+    Time,
+    get_date,
+    get_datetime,
+    get_datetimes,
+    get_day,
+    get_hour,
+    get_minute,
+    get_month,
+    get_second,
+    get_time,
+    get_year,
+    parse_date,
+    parse_datetime,
+    parse_time,
+)
+from aiombus.types.integers import (
+    parse_binary_integer,
+    parse_boolean,
+    parse_unsigned_integer,
+)
+
+__all__ = [
+    "Date",
+    "DateTime",
+    "Time",
+    "get_date",
+    "get_datetime",
+    "get_datetimes",
+    "get_day",
+    "get_hour",
+    "get_minute",
+    "get_month",
+    "get_second",
+    "get_time",
+    "get_year",
+    "parse_binary_integer",
+    "parse_boolean",
+    "parse_date",
+    "parse_datetime",
+    "parse_time",
+    "parse_unsigned_integer",
+]
@@ -0,0 +1,530 @@
+"""M-Bus date and time types (EN 13757-3, data types F and G).
+
+Type G (2 bytes) packs a calendar date:
+
++--------+-----------------------+-----------------------+
+| byte   | bits 7-5              | bits 4-0              |
++--------+-----------------------+-----------------------+
+| 0      | year (low part)       | day                   |
+| 1      | year (high part, 7-4) | month (3-0)           |
++--------+-----------------------+-----------------------+
+
+Type F (4 or 5 bytes) packs a timestamp: minute, hour,
+then the two date bytes as above, then an optional second byte.
+
+Years 0..80 map into 2000..2080, years 81..99 into 1981..1999.
+"""
+
+from collections.abc import Iterable
+from datetime import date, datetime, time
+from functools import lru_cache
+from typing import Self
+
+from struct import Struct
+
+from aiombus.exceptions import MBusDecodeError
+
+SECOND_MASK = 0b0011_1111
+MINUTE_MASK = 0b0011_1111
+HOUR_MASK = 0b0001_1111
+DAY_MASK = 0b0001_1111
+MONTH_MASK = 0b0000_1111
+YEAR_LSP_MASK = 0b1110_0000
+YEAR_MSP_MASK = 0b1111_0000
+
+CENTURY_YEAR_BORDER = 81
+
+#: prebuilt unpackers: one C call fetches a whole frame instead of
+#: one BINARY_SUBSCR per byte.
+_UNPACK2 = Struct("BB").unpack_from
+_UNPACK4 = Struct("BBBB").unpack_from
+_UNPACK5 = Struct("BBBBB").unpack_from
+
+#: full calendar year per 7-bit raw year, built once at import;
+#: the lookup replaces the century branch and addition.
+_YEAR_LUT = tuple(
+    2000 + year if year < CENTURY_YEAR_BORDER else 1900 + year for year in range(128)
+)
+
+
+def get_second(byte: int) -> int:
+    """Extract the second from a type F second byte."""
+    return byte & SECOND_MASK
+
+
+def get_minute(byte: int) -> int:
+    """Extract the minute from a type F minute byte."""
+    return byte & MINUTE_MASK
+
+
+def get_hour(byte: int) -> int:
+    """Extract the hour from a type F hour byte."""
+    return byte & HOUR_MASK
+
+
+def get_day(byte: int) -> int:
+    """Extract the day from a type G day byte."""
+    return byte & DAY_MASK
+
+
+def get_month(byte: int) -> int:
+    """Extract the month from a type G month byte."""
+    return byte & MONTH_MASK
+
+
+def get_year(lsp_byte: int, msp_byte: int) -> int:
+    """Extract the year from the type G day and month bytes."""
+    return _YEAR_LUT[((msp_byte & YEAR_MSP_MASK) | ((lsp_byte & YEAR_LSP_MASK) >> 4)) >> 1]
+
+
+def get_date(ibytes: Iterable[int]) -> date:
+    """Decode a type G date from a 2-byte frame."""
+    frame = ibytes if isinstance(ibytes, (bytes, bytearray, memoryview)) else bytes(ibytes)
+    if len(frame) != 2:
+        msg = f"a type G date frame must be 2 bytes long, got {len(frame)}"
+        raise MBusDecodeError(msg)
+    # inline bit unpacking: straight-line masks, no helper calls
+    # on the hot path (get_* stay as the public per-byte API).
+    day_byte, month_byte = _UNPACK2(frame)
+    year = _YEAR_LUT[((month_byte & YEAR_MSP_MASK) | ((day_byte & YEAR_LSP_MASK) >> 4)) >> 1]
+    return date(
+        year=year,
+        month=month_byte & MONTH_MASK,
+        day=day_byte & DAY_MASK,
+    )
+
+
+def get_time(ibytes: Iterable[int]) -> time:
+    """Decode a time from a 2, 3 or 5 byte type F frame prefix."""
+    frame = ibytes if isinstance(ibytes, (bytes, bytearray, memoryview)) else bytes(ibytes)
+    if len(frame) not in (2, 3, 5):
+        msg = f"a time frame must be 2, 3 or 5 bytes long, got {len(frame)}"
+        raise MBusDecodeError(msg)
+    # the second byte, when present, is always the last one
+    second = frame[-1] & SECOND_MASK if len(frame) != 2 else 0
+    return time(
+        hour=frame[1] & HOUR_MASK,
+        minute=frame[0] & MINUTE_MASK,
+        second=second,
+    )
+
+
+def get_datetime(ibytes: Iterable[int]) -> datetime:
+    """Decode a type F timestamp from a 4 or 5 byte frame."""
+    frame = ibytes if isinstance(ibytes, (bytes, bytearray, memoryview)) else bytes(ibytes)
+    if len(frame) not in (4, 5):
+        msg = f"a type F frame must be 4 or 5 bytes long, got {len(frame)}"
+        raise MBusDecodeError(msg)
+    if len(frame) == 5:
+        minute_byte, hour_byte, day_byte, month_byte, second_byte = _UNPACK5(frame)
+        second = second_byte & SECOND_MASK
+    else:
+        minute_byte, hour_byte, day_byte, month_byte = _UNPACK4(frame)
+        second = 0
+    year = _YEAR_LUT[((month_byte & YEAR_MSP_MASK) | ((day_byte & YEAR_LSP_MASK) >> 4)) >> 1]
+    return datetime(
+        year=year,
+        month=month_byte & MONTH_MASK,
+        day=day_byte & DAY_MASK,
+        hour=hour_byte & HOUR_MASK,
+        minute=minute_byte & MINUTE_MASK,
+        second=second,
+    )
+
+
+def get_datetimes(buf: bytes | bytearray, *, frame_size: int = 5) -> list[datetime]:
+    """Decode a batch of consecutive fixed-size type F frames.
+
+    ``buf`` holds ``len(buf) / frame_size`` frames laid out back to back;
+    ``frame_size`` is 4 (no seconds) or 5.  The whole buffer is decoded
+    in one sweep, which is the preferred path for telegrams carrying
+    many timestamps (logs, historical records).
+    """
+    if frame_size not in (4, 5):
+        msg = f"a type F frame must be 4 or 5 bytes long, got {frame_size}"
+        raise MBusDecodeError(msg)
+    if len(buf) % frame_size:
+        msg = f"buffer length {len(buf)} is not a multiple of {frame_size}"
+        raise MBusDecodeError(msg)
+    # one flat loop with the bit unpacking inlined: no slicing, no
+    # intermediate bytes objects and no per-frame function call.
+    result = []
+    append = result.append
+    with_seconds = frame_size == 5
+    for pos in range(0, len(buf), frame_size):
+        day_byte, month_byte = buf[pos + 2], buf[pos + 3]
+        year = _YEAR_LUT[
+            ((month_byte & YEAR_MSP_MASK) | ((day_byte & YEAR_LSP_MASK) >> 4)) >> 1
+        ]
+        append(
+            datetime(
+                year=year,
+                month=month_byte & MONTH_MASK,
+                day=day_byte & DAY_MASK,
+                hour=buf[pos + 1] & HOUR_MASK,
+                minute=buf[pos] & MINUTE_MASK,
+                second=buf[pos + 4] & SECOND_MASK if with_seconds else 0,
+            )
+        )
+    return result
+
+
+class Date:
+    """A type G calendar date value object.
+
+    Holds the decoded subfields only; the stdlib ``date`` (with its
+    range validation and allocation) is materialized lazily on
+    first access.
+    """
+
+    __slots__ = ("_raw", "_date")
+
+    def __init__(self, ibytes: Iterable[int]) -> None:
+        frame = (
+            ibytes
+            if isinstance(ibytes, (bytes, bytearray, memoryview))
+            else bytes(ibytes)
+        )
+        if len(frame) != 2:
+            msg = f"a type G date frame must be 2 bytes long, got {len(frame)}"
+            raise MBusDecodeError(msg)
+        day_byte, month_byte = frame[0], frame[1]
+        year = _YEAR_LUT[
+            ((month_byte & YEAR_MSP_MASK) | ((day_byte & YEAR_LSP_MASK) >> 4)) >> 1
+        ]
+        self._raw = (year, month_byte & MONTH_MASK, day_byte & DAY_MASK)
+        self._date: date | None = None
+
+    @classmethod
+    def _from_word(cls, word: int) -> Self:
+        """Construct the date from the two frame bytes as one word.
+
+        The single parse path behind every constructor: pure bit ops
+        on an int, no intermediate buffers or stdlib objects.
+        """
+        obj = object.__new__(cls)
+        obj._raw = (
+            _YEAR_LUT[((word >> 9) & 0x78) | ((word >> 5) & 0x07)],
+            (word >> 8) & MONTH_MASK,
+            word & DAY_MASK,
+        )
+        obj._date = None
+        return obj
+
+    @classmethod
+    def from_hexstring(cls, hex_: str) -> Self:
+        """Construct the date from a hex string (memoized)."""
+        return _date_from_hex(cls, hex_)
+
+    @classmethod
+    def from_bytearray(cls, frame: bytearray | bytes) -> Self:
+        """Construct the date from a byte buffer."""
+        if len(frame) != 2:
+            msg = f"a type G date frame must be 2 bytes long, got {len(frame)}"
+            raise MBusDecodeError(msg)
+        return cls._from_word(frame[0] | (frame[1] << 8))
+
+    @classmethod
+    def from_integers(cls, ints: Iterable[int]) -> Self:
+        """Construct the date from an iterable of integers."""
+        return cls.from_bytearray(bytes(ints))
+
+    @property
+    def date(self) -> date:
+        """The decoded calendar date."""
+        decoded = self._date
+        if decoded is None:
+            decoded = self._date = date(*self._raw)
+        return decoded
+
+    def to_iso_format(self) -> str:
+        """The date as an ISO 8601 ``YYYY-MM-DD`` string."""
+        # %-formatting against the stored tuple dispatches to one
+        # C-level format call, no per-field f-string machinery
+        return "%04d-%02d-%02d" % self._raw
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}{self._raw!r}"
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Date):
+            return self._raw == other._raw
+        if isinstance(other, date):
+            return self.date == other
+        if isinstance(other, (tuple, list)) and len(other) == 3:
+            return self._raw == tuple(other)
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self._raw)
+
+
+class Time:
+    """A type F time-of-day value object.
+
+    Holds the decoded subfields only; the stdlib ``time`` is
+    materialized lazily on first access.
+    """
+
+    __slots__ = ("_raw", "_time")
+
+    def __init__(self, ibytes: Iterable[int]) -> None:
+        frame = (
+            ibytes
+            if isinstance(ibytes, (bytes, bytearray, memoryview))
+            else bytes(ibytes)
+        )
+        if len(frame) not in (2, 3, 5):
+            msg = f"a time frame must be 2, 3 or 5 bytes long, got {len(frame)}"
+            raise MBusDecodeError(msg)
+        second = frame[-1] & SECOND_MASK if len(frame) != 2 else 0
+        self._raw = (frame[1] & HOUR_MASK, frame[0] & MINUTE_MASK, second)
+        self._time: time | None = None
+
+    @classmethod
+    def from_hexstring(cls, hex_: str) -> Self:
+        """Construct the time from a hex string (memoized)."""
+        return _time_from_hex(cls, hex_)
+
+    @classmethod
+    def from_bytearray(cls, frame: bytearray | bytes) -> Self:
+        """Construct the time from a byte buffer."""
+        return cls(frame)
+
+    @classmethod
+    def from_integers(cls, ints: Iterable[int]) -> Self:
+        """Construct the time from an iterable of integers."""
+        return cls(bytes(ints))
+
+    @property
+    def time(self) -> time:
+        """The decoded time of day."""
+        decoded = self._time
+        if decoded is None:
+            decoded = self._time = time(*self._raw)
+        return decoded
+
+    def to_hhmm_format(self) -> str:
+        """The time as an ``HH:MM`` string."""
+        # formats straight from the stored ints without
+        # materializing the stdlib time object
+        return "%02d:%02d" % self._raw[:2]
+
+    def to_hhmmss_format(self) -> str:
+        """The time as an ``HH:MM:SS`` string."""
+        return "%02d:%02d:%02d" % self._raw
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}{self._raw!r}"
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, Time):
+            return self._raw == other._raw
+        if isinstance(other, time):
+            return self.time == other
+        if isinstance(other, (tuple, list)) and len(other) == 3:
+            return self._raw == tuple(other)
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self._raw)
+
+
+class DateTime:
+    """A type F timestamp value object.
+
+    The six subfields are bit-packed into one int (year << 26 down
+    to second in the low 6 bits); the stdlib ``datetime`` is
+    materialized lazily on first access.
+    """
+
+    __slots__ = ("_bits", "_datetime")
+
+    def __init__(self, ibytes: Iterable[int]) -> None:
+        frame = (
+            ibytes
+            if isinstance(ibytes, (bytes, bytearray, memoryview))
+            else bytes(ibytes)
+        )
+        if len(frame) not in (4, 5):
+            msg = f"a type F frame must be 4 or 5 bytes long, got {len(frame)}"
+            raise MBusDecodeError(msg)
+        # the whole frame packed into one int: the subfields are then
+        # extracted with shifts and masks only, without per-byte
+        # indexing or a branch for the optional seconds byte
+        # (a 4-byte frame leaves the second bits zero).
+        word = int.from_bytes(frame, "little")
+        self._bits = (
+            (_YEAR_LUT[((word >> 25) & 0x78) | ((word >> 21) & 0x07)] << 26)
+            | (((word >> 24) & MONTH_MASK) << 22)
+            | (((word >> 16) & DAY_MASK) << 17)
+            | (((word >> 8) & HOUR_MASK) << 12)
+            | ((word & MINUTE_MASK) << 6)
+            | ((word >> 32) & SECOND_MASK)
+        )
+        self._datetime: datetime | None = None
+
+    @classmethod
+    def decode_many(cls, buf: bytes | bytearray, *, frame_size: int = 5) -> list[Self]:
+        """Decode a batch of consecutive fixed-size type F frames.
+
+        The bulk counterpart of ``get_datetimes`` for object
+        consumers: one flat loop packs each frame straight into the
+        bit word, skipping per-frame validation and keeping the
+        stdlib datetimes unmaterialized until asked for.
+        """
+        if frame_size not in (4, 5):
+            msg = f"a type F frame must be 4 or 5 bytes long, got {frame_size}"
+            raise MBusDecodeError(msg)
+        if len(buf) % frame_size:
+            msg = f"buffer length {len(buf)} is not a multiple of {frame_size}"
+            raise MBusDecodeError(msg)
+        result = []
+        append = result.append
+        with_seconds = frame_size == 5
+        new = object.__new__
+        for pos in range(0, len(buf), frame_size):
+            day_byte, month_byte = buf[pos + 2], buf[pos + 3]
+            year = _YEAR_LUT[
+                ((month_byte & YEAR_MSP_MASK) | ((day_byte & YEAR_LSP_MASK) >> 4)) >> 1
+            ]
+            obj = new(cls)
+            obj._bits = (
+                (year << 26)
+                | ((month_byte & MONTH_MASK) << 22)
+                | ((day_byte & DAY_MASK) << 17)
+                | ((buf[pos + 1] & HOUR_MASK) << 12)
+                | ((buf[pos] & MINUTE_MASK) << 6)
+                | (buf[pos + 4] & SECOND_MASK if with_seconds else 0)
+            )
+            obj._datetime = None
+            append(obj)
+        return result
+
+    @property
+    def year(self) -> int:
+        """The year of the timestamp."""
+        return self._bits >> 26
+
+    @property
+    def month(self) -> int:
+        """The month of the timestamp."""
+        return (self._bits >> 22) & 0xF
+
+    @property
+    def day(self) -> int:
+        """The day of the timestamp."""
+        return (self._bits >> 17) & 0x1F
+
+    @property
+    def hour(self) -> int:
+        """The hour of the timestamp."""
+        return (self._bits >> 12) & 0x1F
+
+    @property
+    def minute(self) -> int:
+        """The minute of the timestamp."""
+        return (self._bits >> 6) & 0x3F
+
+    @property
+    def second(self) -> int:
+        """The second of the timestamp."""
+        return self._bits & 0x3F
+
+    @classmethod
+    def from_hexstring(cls, hex_: str) -> Self:
+        """Construct the timestamp from a hex string (memoized)."""
+        return _datetime_from_hex(cls, hex_)
+
+    @classmethod
+    def from_bytearray(cls, frame: bytearray | bytes) -> Self:
+        """Construct the timestamp from a byte buffer."""
+        return cls(frame)
+
+    @classmethod
+    def from_integers(cls, ints: Iterable[int]) -> Self:
+        """Construct the timestamp from an iterable of integers."""
+        return cls(bytes(ints))
+
+    @property
+    def datetime(self) -> datetime:
+        """The decoded timestamp."""
+        decoded = self._datetime
+        if decoded is None:
+            bits = self._bits
+            decoded = self._datetime = datetime(
+                bits >> 26,
+                (bits >> 22) & 0xF,
+                (bits >> 17) & 0x1F,
+                (bits >> 12) & 0x1F,
+                (bits >> 6) & 0x3F,
+                bits & 0x3F,
+            )
+        return decoded
+
+    def to_iso_format(self) -> str:
+        """The timestamp as an ISO 8601 string."""
+        # formats straight from the bit word without materializing
+        # the stdlib datetime object
+        return "%04d-%02d-%02dT%02d:%02d:%02d" % self._as_tuple()
+
+    def _as_tuple(self) -> tuple[int, int, int, int, int, int]:
+        bits = self._bits
+        return (
+            bits >> 26,
+            (bits >> 22) & 0xF,
+            (bits >> 17) & 0x1F,
+            (bits >> 12) & 0x1F,
+            (bits >> 6) & 0x3F,
+            bits & 0x3F,
+        )
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}{self._as_tuple()!r}"
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, DateTime):
+            return self._bits == other._bits
+        if isinstance(other, datetime):
+            return self.datetime == other
+        if isinstance(other, (tuple, list)) and len(other) == 6:
+            return self._as_tuple() == tuple(other)
+        return NotImplemented
+
+    def __hash__(self) -> int:
+        return hash(self._bits)
+
+
+#: memoized hex constructors: short frames repeat across a stream,
+#: so recurring hex strings skip fromhex and the date() rebuild.
+@lru_cache(maxsize=4096)
+def _date_from_hex(cls: type[Date], hex_: str) -> Date:
+    return cls.from_bytearray(bytes.fromhex(hex_))
+
+
+@lru_cache(maxsize=4096)
+def _time_from_hex(cls: type[Time], hex_: str) -> Time:
+    return cls(bytes.fromhex(hex_))
+
+
+@lru_cache(maxsize=4096)
+def _datetime_from_hex(cls: type[DateTime], hex_: str) -> DateTime:
+    return cls(bytes.fromhex(hex_))
+
+
+def parse_date(frame: Iterable[int]) -> date:
+    """Parse a type G date from the head of ``frame``."""
+    buf = bytes(frame)
+    return get_date(buf[:2])
+
+
+def parse_time(frame: Iterable[int]) -> time:
+    """Parse a time from the head of ``frame``."""
+    buf = bytes(frame)
+    return get_time(buf if len(buf) in (3, 5) else buf[:2])
+
+
+def parse_datetime(frame: Iterable[int]) -> datetime:
+    """Parse a type F timestamp from the head of ``frame``."""
+    buf = bytes(frame)
+    return get_datetime(buf[:5] if len(buf) >= 5 else buf[:4])
@@ -0,0 +1,39 @@
+"""Binary integer data decoding (EN 13757-3).
+
+Multi-byte M-Bus integers travel least significant byte first;
+signed (Type B) values use two's complement.
+"""
+
+from collections.abc import Iterable
+
+from aiombus.exceptions import MBusDecodeError
+
+LITTLE_ENDIAN = "little"
+
+
+def parse_binary_integer(ibytes: Iterable[int]) -> int:
+    """Parse a signed (Type B) binary integer from ``ibytes``.
+
+    The whole shift/accumulate runs inside ``int.from_bytes``, which
+    also applies the two's complement of the sign bit, so no per-byte
+    Python loop is involved.
+    """
+    buf = ibytes if isinstance(ibytes, (bytes, bytearray)) else bytes(ibytes)
+    if not buf:
+        msg = "no bytes to parse a binary integer from"
+        raise MBusDecodeError(msg)
+    return int.from_bytes(buf, byteorder=LITTLE_ENDIAN, signed=True)
+
+
+def parse_unsigned_integer(ibytes: Iterable[int]) -> int:
+    """Parse an unsigned binary integer from ``ibytes``."""
+    buf = ibytes if isinstance(ibytes, (bytes, bytearray)) else bytes(ibytes)
+    if not buf:
+        msg = "no bytes to parse an unsigned integer from"
+        raise MBusDecodeError(msg)
+    return int.from_bytes(buf, byteorder=LITTLE_ENDIAN)
+
+
+def parse_boolean(ibytes: Iterable[int]) -> bool:
+    """Whether any byte of ``ibytes`` is non-zero."""
+    return any(ibytes)
@@ -0,0 +1,15 @@
+"""Validators for M-Bus primitives."""
+
+from aiombus.exceptions import MBusValidationError
+
+
+def validate_byte(nbr: int) -> int:
+    """Return ``nbr`` if it fits into an unsigned byte.
+
+    Raises:
+        MBusValidationError: if ``nbr`` is not within the [0; 255] segment.
+    """
+    if nbr.__class__ is int and not (nbr & ~0xFF):
+        return nbr
+    msg = f"{nbr!r} is not within the [0; 255] segment"
+    raise MBusValidationError(msg)
@@ -0,0 +1,9 @@
+"""Shared helpers for the test suite."""
+
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def hex2bytes(hexdata: str) -> bytes:
+    """Parse ``hexdata`` once and reuse the buffer across tests."""
+    return bytes.fromhex(hexdata)
@@ -0,0 +1,37 @@
+import pytest
+
+from aiombus.structures.fixed_data_structure import (
+    MeasuredMedium,
+    PhysicalUnits,
+    medium_of,
+    unit_of,
+)
+
+
+@pytest.mark.parametrize(
+    ("byte", "answer"),
+    [
+        (0x22, MeasuredMedium.electricity),
+        (0x07, MeasuredMedium.water),
+        (0xFF, MeasuredMedium.unknown),
+    ],
+)
+def test_medium_of(byte: int, answer: MeasuredMedium):
+    assert medium_of(byte) is answer
+
+
+@pytest.mark.parametrize(
+    ("byte", "answer"),
+    [
+        (0x02, PhysicalUnits.Wh),
+        (0x35, PhysicalUnits.cubic_metre_per_hour),
+        (0x7F, PhysicalUnits.without_units),
+    ],
+)
+def test_unit_of(byte: int, answer: PhysicalUnits):
+    assert unit_of(byte) is answer
+
+
+def test_tables_are_dense():
+    assert [m.value for m in MeasuredMedium] == list(range(16))
+    assert [u.value for u in PhysicalUnits] == list(range(64))
@@ -0,0 +1,21 @@
+from aiombus.tables import di
+from aiombus.tables.di import DataFieldEnum, FunctionFieldEnum, df_from_byte
+
+
+def test_data_field_enum_is_dense():
+    assert [df.value for df in DataFieldEnum] == list(range(16))
+
+
+def test_function_field_enum_is_dense():
+    assert [ff.value for ff in FunctionFieldEnum] == list(range(4))
+
+
+def test_df_from_byte_matches_enum_call():
+    assert all(df_from_byte(i) is DataFieldEnum(i) for i in range(16))
+
+
+def test_constants_mirror_enum_members():
+    for member in DataFieldEnum:
+        assert getattr(di, member.name.upper()) == member.value
+    for member in FunctionFieldEnum:
+        assert getattr(di, member.name.upper()) == member.value
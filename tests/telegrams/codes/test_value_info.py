@@ -0,0 +1,76 @@
+import pytest
+
+from aiombus.telegrams.codes.value_info import (
+    EnergyJouleVIFCode,
+    EnergyWattHourVIFCode,
+    OnTimeVIFCode,
+    PowerWattVIFCode,
+    VolumeMeterCubeVIFCode,
+    get_vif_code,
+)
+from aiombus.telegrams.fields.value_info import ValueInformationField as VIF
+
+
+@pytest.mark.parametrize(
+    ("byte", "cls"),
+    [
+        (0x03, EnergyWattHourVIFCode),
+        (0x0F, EnergyJouleVIFCode),
+        (0x13, VolumeMeterCubeVIFCode),
+        (0x20, OnTimeVIFCode),
+        (0x2B, PowerWattVIFCode),
+        (0x83, EnergyWattHourVIFCode),  # the extension bit is ignored
+    ],
+)
+def test_get_vif_code_dispatch(byte: int, cls: type):
+    assert type(get_vif_code(VIF(byte))) is cls
+
+
+@pytest.mark.parametrize(
+    ("byte", "multiplier"),
+    [
+        (0x03, 1),
+        (0x00, 0.001),
+        (0x13, 0.001),
+        (0x2E, 1000),
+    ],
+)
+def test_vif_code_multipliers(byte: int, multiplier: float):
+    code = get_vif_code(VIF(byte))
+    assert code.multiplier == multiplier
+
+
+@pytest.mark.parametrize(
+    ("cls", "byte", "answer"),
+    [
+        (EnergyWattHourVIFCode, 0x03, True),
+        (EnergyWattHourVIFCode, 0x83, True),
+        (EnergyWattHourVIFCode, 0x0F, False),
+        (OnTimeVIFCode, 0x22, True),
+        (OnTimeVIFCode, 0x24, False),
+    ],
+)
+def test_vif_code_matches(cls: type, byte: int, answer: bool):
+    assert cls.matches(byte) is answer
+
+
+def test_get_vif_code_is_memoized():
+    assert get_vif_code(VIF(0x03)) is get_vif_code(VIF(0x83))
+
+
+def test_get_vif_code_unknown_byte():
+    assert get_vif_code(VIF(0x7F)) is None
+
+
+@pytest.mark.parametrize(
+    ("byte", "unit"),
+    [
+        (0x20, "second"),
+        (0x21, "minute"),
+        (0x22, "hour"),
+        (0x23, "day"),
+        (0x26, "hour"),  # operating time shares the unit coding
+    ],
+)
+def test_time_vif_code_units(byte: int, unit: str):
+    assert get_vif_code(VIF(byte)).UNIT == unit
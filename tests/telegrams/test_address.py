@@ -0,0 +1,24 @@
+import pytest
+
+from aiombus.telegrams.fields.address import AddressField
+
+
+@pytest.mark.parametrize(
+    ("byte", "predicate", "answer"),
+    [
+        (0, "is_unconfigured_slave", True),
+        (0, "is_configured_slave", False),
+        (0, "is_slave", True),
+        (1, "is_configured_slave", True),
+        (250, "is_slave", True),
+        (251, "is_slave", False),
+        (253, "is_network_layer", True),
+        (254, "is_broadcast_all_reply", True),
+        (254, "is_broadcast", True),
+        (255, "is_broadcast_no_replies", True),
+        (255, "is_broadcast", True),
+        (42, "is_broadcast", False),
+    ],
+)
+def test_address_field_predicates(byte: int, predicate: str, answer: bool):
+    assert getattr(AddressField(byte), predicate) is answer
@@ -0,0 +1,22 @@
+import pytest
+
+from aiombus.telegrams.fields.control import ControlField
+
+
+@pytest.mark.parametrize(
+    ("byte", "attribute", "answer"),
+    [
+        (0x53, "is_calling_direction", True),  # SND_UD
+        (0x53, "function_code", 0x3),
+        (0x53, "fcb", 0),
+        (0x53, "fcv", 1),
+        (0x73, "fcb", 1),  # SND_UD with FCB set
+        (0x5B, "function_code", 0xB),  # REQ_UD2
+        (0x08, "is_reply", True),  # RSP_UD
+        (0x08, "is_calling_direction", False),
+        (0x40, "function_code", 0x0),  # SND_NKE
+        (0x40, "is_reply", False),
+    ],
+)
+def test_control_field_decoding(byte: int, attribute: str, answer):
+    assert getattr(ControlField(byte), attribute) == answer
@@ -0,0 +1,228 @@
+from contextlib import nullcontext as does_not_raise
+
+import pytest
+
+from aiombus.exceptions import MBusDecodeError, MBusValidationError
+from aiombus.telegrams.blocks.dib import DataInformationBlock as DIB
+from aiombus.telegrams.fields.data_info import (
+    DIF_POOL,
+    DataInformationField as DIF,
+    DataInformationFieldExtension as DIFE,
+    unpack_difs,
+)
+
+#: shared expectation contexts: built once at import so collection
+#: does not construct a context manager per case
+_OK = does_not_raise()
+_DECODE_ERROR = pytest.raises(MBusDecodeError)
+_VALIDATION_ERROR = pytest.raises(MBusValidationError)
+
+_DIB_INIT_CASES = (
+    ([], _DECODE_ERROR),
+    ([0x0C], _OK),
+    ([0x8C, 0x04], _OK),
+    ([0x8C] * 10 + [0x04], _OK),
+    ([0x8C] * 12 + [0x04], _DECODE_ERROR),
+)
+
+
+@pytest.mark.parametrize(
+    ("byte", "answer"),
+    [
+        (0b0000_0000, 0),
+        (0b0111_1111, 0),
+        (0b1000_0000, 1),
+        (0b1111_1111, 1),
+    ],
+)
+def test_dif_extension_bit(byte: int, answer: int):
+    assert DIF(byte).extension_bit == answer
+
+
+@pytest.mark.parametrize(
+    ("byte", "answer"),
+    [
+        (0b0000_0000, 0),
+        (0b0100_0000, 1),
+        (0b1011_1111, 0),
+    ],
+)
+def test_dif_storage_number_lsb(byte: int, answer: int):
+    assert DIF(byte).storage_number_lsb == answer
+
+
+@pytest.mark.parametrize(
+    ("byte", "answer"),
+    [
+        (0b0000_0000, 0b00),
+        (0b0001_0000, 0b01),
+        (0b0010_0000, 0b10),
+        (0b0011_0000, 0b11),
+    ],
+)
+def test_dif_function_field(byte: int, answer: int):
+    assert DIF(byte).function_field == answer
+
+
+@pytest.mark.parametrize(
+    ("byte", "answer"),
+    [
+        (0b0000_0000, 0b0000),
+        (0b0000_0111, 0b0111),
+        (0b0011_1111, 0b1111),
+    ],
+)
+def test_dif_data_field(byte: int, answer: int):
+    assert DIF(byte).data_field == answer
+
+
+@pytest.mark.parametrize(
+    ("byte", "answer"),
+    [
+        (0b0000_0000, (0, 0, 0)),
+        (0b0100_1010, (1, 0, 0b1010)),
+        (0b1011_0101, (0, 0b11, 0b0101)),
+    ],
+)
+def test_dife_fields(byte: int, answer: tuple[int, int, int]):
+    dife = DIFE(byte)
+    assert (dife.device_unit, dife.tariff, dife.storage_number) == answer
+
+
+@pytest.mark.parametrize(("it", "expectation"), _DIB_INIT_CASES)
+def test_dib_init(it: list[int], expectation):
+    with expectation:
+        DIB(bytearray(it))
+
+
+def test_dif_byte_validation():
+    with _VALIDATION_ERROR:
+        DIF(256)
+
+
+def test_dib_init_from_hexstring():
+    dib = DIB.from_hexstring("8C 85 04")
+
+    assert dib.dif == DIF(0x8C)
+    assert dib.difes == (DIFE(0x85), DIFE(0x04))
+
+
+def test_dib_init_from_integers():
+    assert DIB.from_integers([0x8C, 0x85, 0x04]) == DIB(bytes([0x8C, 0x85, 0x04]))
+
+
+def test_dib_dif_and_difes():
+    dib = DIB(bytearray([0x8C, 0x85, 0x04]))
+
+    assert dib.dif == DIF(0x8C)
+    assert dib.difes == (DIFE(0x85), DIFE(0x04))
+
+
+def test_for_loop_over_dib():
+    barr = bytearray([0x8C, 0x85, 0x04])
+
+    for df, byte in zip(DIB(barr), barr, strict=True):
+        assert df.byte == byte
+
+
+def test_unpack_difs():
+    buf = bytes([0b1011_0101, 0b0100_1010])
+
+    data, func, sn_lsb, ext = unpack_difs(buf)
+
+    assert data == (0b0101, 0b1010)
+    assert func == (0b11, 0b00)
+    assert sn_lsb == (0, 1)
+    assert ext == (1, 0)
+
+
+def test_decode_many_difs():
+    buf = bytes([0b1011_0101, 0b0100_1010])
+
+    difs = DIF.decode_many(buf)
+
+    assert [dif.byte for dif in difs] == list(buf)
+    assert all(DIF_POOL[byte] is dif for byte, dif in zip(buf, difs))
+
+
+@pytest.mark.parametrize(
+    ("buf", "start", "answer"),
+    [
+        (b"\x04", 0, 1),
+        (b"\x8c\x85\x04\xff", 0, 3),
+        (b"\x8c\x85\x04\xff", 1, 3),
+        (b"\x8c\x85", 0, 2),
+        (b"\x8c" * 9 + b"\x04", 0, 10),
+        (b"\x8c" * 12, 0, 12),
+    ],
+)
+def test_scan_ext_chain(buf: bytes, start: int, answer: int):
+    from aiombus.telegrams.blocks._scan import scan_ext_chain
+
+    assert scan_ext_chain(buf, start) == answer
+
+
+def test_dif_equality_and_hash():
+    assert DIF(0x8C) == 0x8C
+    assert DIF(0x8C) == DIF(0x8C)
+    assert DIF(0x8C) != DIF(0x04)
+    assert hash(DIF(0x8C)) == 0x8C
+    assert DIF(0x8C) != "0x8c"
+
+
+def test_dib_rejects_non_buffer_input():
+    with _VALIDATION_ERROR:
+        DIB([0x04])
+
+
+def test_encoding_byte_is_polymorphic():
+    assert DIF(0b1011_0101).encoding_byte == 0b0101
+    assert DIFE(0b0100_1010).encoding_byte == 0b1010
+
+
+def test_dif_constructor_interns():
+    assert DIF(0x8C) is DIF(0x8C) is DIF_POOL[0x8C]
+
+
+def test_dib_fields_are_pooled():
+    first = DIB(bytes([0x8C, 0x04]))
+    second = DIB(bytes([0x8C, 0x04]))
+
+    assert first.dif is second.dif
+    assert first.difes[0] is second.difes[0]
+
+
+def test_dib_bytes_are_immutable_and_hashable():
+    dib = DIB(bytes([0x8C, 0x04]))
+
+    assert isinstance(dib.bytes, bytes)
+    assert hash(dib) == hash(DIB(bytes([0x8C, 0x04])))
+
+
+def test_dib_no_dife_shares_empty_tuple():
+    assert DIB(bytes([0x04])).difes is DIB(bytes([0x0C])).difes == ()
+
+
+def test_dib_difes_are_lazy_and_cached():
+    dib = DIB(bytes([0x8C, 0x85, 0x04]))
+
+    assert dib._difes is None
+    assert dib.difes == (DIFE(0x85), DIFE(0x04))
+    assert dib.difes is dib._difes
+
+
+def test_dib_consume():
+    buf = bytes([0x22, 0x8C, 0x85, 0x04, 0x13])
+
+    dib, off = DIB.consume(buf, 1)
+
+    assert dib == DIB(bytes([0x8C, 0x85, 0x04]))
+    assert off == 4
+
+
+def test_scan_ext_chains():
+    from aiombus.telegrams.blocks._scan import scan_ext_chains
+
+    buf = bytes([0x84, 0x04, 0x86, 0x3B, 0x13, 0x8C, 0x85])
+
+    assert scan_ext_chains(buf) == [2, 4, 5, 7]
@@ -0,0 +1,41 @@
+import pytest
+
+from aiombus.exceptions import MBusDecodeError
+from aiombus.telegrams.blocks.dib import DataInformationBlock as DIB
+from aiombus.telegrams.blocks.drh import DataRecordHeader as DRH
+from aiombus.telegrams.blocks.vib import ValueInformationBlock as VIB
+
+
+def test_drh_split():
+    frame = bytes([0x84, 0x04, 0x86, 0x3B, 0x01, 0x02])
+
+    drh = DRH(frame)
+
+    assert drh.dib == DIB(bytes([0x84, 0x04]))
+    assert drh.vib == VIB(bytes([0x86, 0x3B]))
+    assert drh.data == bytes([0x01, 0x02])
+
+
+def test_drh_no_data():
+    drh = DRH(bytes([0x04, 0x13]))
+
+    assert drh.dib == DIB(bytes([0x04]))
+    assert drh.vib == VIB(bytes([0x13]))
+    assert drh.data == b""
+
+
+def test_drh_empty_frame():
+    with pytest.raises(MBusDecodeError):
+        DRH(b"")
+
+
+def test_drh_missing_vib():
+    with pytest.raises(MBusDecodeError):
+        DRH(bytes([0x04]))
+
+
+def test_split_drh_offsets():
+    from aiombus.telegrams.blocks.drh import split_drh
+
+    assert split_drh(bytes([0x84, 0x04, 0x86, 0x3B, 0x01, 0x02])) == (2, 4)
+    assert split_drh(bytes([0x04, 0x13])) == (1, 2)
@@ -0,0 +1,64 @@
+from contextlib import nullcontext as does_not_raise
+
+import pytest
+
+from aiombus.exceptions import MBusDecodeError
+from aiombus.telegrams.frames import ACK_BYTE, ShortFrame, SingleFrame
+
+#: shared expectation contexts: built once at import so collection
+#: does not construct a context manager per case
+_OK = does_not_raise()
+_DECODE_ERROR = pytest.raises(MBusDecodeError)
+
+_SHORT_FRAME_CASES = (
+    ([0x10, 0x7B, 0x8B, 0x06, 0x16], _OK),
+    ([0x10, 0x7B, 0x8B, 0x06], _DECODE_ERROR),
+    ([0x10, 0x7B, 0x8B, 0x06, 0x16, 0x00], _DECODE_ERROR),
+    ([0x68, 0x7B, 0x8B, 0x06, 0x16], _DECODE_ERROR),
+    ([0x10, 0x7B, 0x8B, 0x06, 0x15], _DECODE_ERROR),
+    ([0x10, 0x7B, 0x8B, 0x07, 0x16], _DECODE_ERROR),
+)
+
+
+def test_single_frame_init():
+    frame = SingleFrame()
+
+    assert list(frame) == [ACK_BYTE]
+    assert frame.bytes == bytes([ACK_BYTE])
+
+    with _DECODE_ERROR:
+        SingleFrame(0x10)
+
+
+@pytest.mark.parametrize(("data", "expectation"), _SHORT_FRAME_CASES)
+def test_short_frame_init(data: list[int], expectation):
+    with expectation:
+        ShortFrame(data)
+
+
+def test_short_frame_fields():
+    frame = ShortFrame([0x10, 0x7B, 0x8B, 0x06, 0x16])
+
+    assert frame.control_field == 0x7B
+    assert frame.address_field == 0x8B
+    assert frame.check_sum == 0x06
+    assert frame.bytes == bytes([0x10, 0x7B, 0x8B, 0x06, 0x16])
+    assert list(frame) == [0x10, 0x7B, 0x8B, 0x06, 0x16]
+
+
+def test_short_frame_fields_are_pooled():
+    buf = bytes([0x10, 0x7B, 0x8B, 0x06, 0x16])
+
+    one, two = ShortFrame(buf), ShortFrame(buf)
+
+    assert one.control_field is two.control_field
+    assert one.address_field is two.address_field
+
+
+def test_short_frame_from_bytes():
+    buf = bytes([0x10, 0x7B, 0x8B, 0x06, 0x16])
+
+    assert ShortFrame.from_bytes(buf) == ShortFrame(buf)
+
+    with _DECODE_ERROR:
+        ShortFrame.from_bytes(buf[:4])
@@ -0,0 +1,63 @@
+from contextlib import nullcontext as does_not_raise
+
+import pytest
+
+from aiombus.exceptions import MBusDecodeError
+from aiombus.telegrams.blocks.vib import ValueInformationBlock as VIB
+from aiombus.telegrams.fields.value_info import (
+    ValueInformationField as VIF,
+    ValueInformationFieldExtension as VIFE,
+)
+
+#: shared expectation contexts: built once at import so collection
+#: does not construct a context manager per case
+_OK = does_not_raise()
+_DECODE_ERROR = pytest.raises(MBusDecodeError)
+
+_VIB_INIT_CASES = (
+    ([], _DECODE_ERROR),
+    ([0x13], _OK),
+    ([0x86, 0x3B], _OK),
+    ([0x86] * 12 + [0x3B], _DECODE_ERROR),
+)
+
+
+@pytest.mark.parametrize(
+    ("byte", "answer"),
+    [
+        (0b0000_0000, (0, 0)),
+        (0b1011_1011, (1, 0b011_1011)),
+        (0b0111_1111, (0, 0b111_1111)),
+    ],
+)
+def test_vif_fields(byte: int, answer: tuple[int, int]):
+    vif = VIF(byte)
+    assert (vif.extension_bit, vif.data) == answer
+
+
+@pytest.mark.parametrize(("it", "expectation"), _VIB_INIT_CASES)
+def test_vib_init(it: list[int], expectation):
+    with expectation:
+        VIB(bytearray(it))
+
+
+def test_vib_vif_and_vifes():
+    vib = VIB(bytearray([0x86, 0xBB, 0x3B]))
+
+    assert vib.vif == VIF(0x86)
+    assert vib.vifes == (VIFE(0xBB), VIFE(0x3B))
+
+
+def test_vif_constructor_interns():
+    assert VIF(0x86) is VIF(0x86)
+    assert VIFE(0xBB) is VIFE(0xBB)
+    assert VIF(0x86) is not VIFE(0x86)
+
+
+def test_vib_consume():
+    buf = bytes([0x04, 0x86, 0xBB, 0x3B, 0x13])
+
+    vib, off = VIB.consume(buf, 1)
+
+    assert vib == VIB(bytes([0x86, 0xBB, 0x3B]))
+    assert off == 4
@@ -0,0 +1,27 @@
+from contextlib import nullcontext as does_not_raise
+
+import pytest
+
+from aiombus.exceptions import MBusValidationError
+from aiombus.validators import validate_byte
+
+#: shared expectation contexts: built once at import so collection
+#: does not construct a context manager per case
+_OK = does_not_raise()
+_INVALID = pytest.raises(MBusValidationError)
+
+_BYTE_CASES = (
+    (0, _OK),
+    (255, _OK),
+    (-1, _INVALID),
+    (256, _INVALID),
+    (3.14, _INVALID),
+    ("0", _INVALID),
+    (None, _INVALID),
+)
+
+
+@pytest.mark.parametrize(("nbr", "expectation"), _BYTE_CASES)
+def test_byte_size_validator(nbr, expectation):
+    with expectation:
+        assert validate_byte(nbr) == nbr
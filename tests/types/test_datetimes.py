@@ -0,0 +1,179 @@
+from contextlib import nullcontext as does_not_raise
+from datetime import date, datetime, time
+
+import pytest
+
+from aiombus.exceptions import MBusDecodeError
+from tests._helpers import hex2bytes
+from aiombus.types.datetimes import (
+    Date,
+    DateTime,
+    Time,
+    get_date,
+    get_datetime,
+    get_datetimes,
+    get_time,
+    get_year,
+    parse_date,
+    parse_datetime,
+    parse_time,
+)
+
+#: shared expectation contexts: built once at import so collection
+#: does not construct a context manager per case
+_OK = does_not_raise()
+_DECODE_ERROR = pytest.raises(MBusDecodeError)
+
+#: frames pre-decoded once at import so the measured calls receive
+#: wire-shaped bytes without per-run hex parsing
+_DATE_CASES = (
+    (hex2bytes("6A 28"), date(2019, 8, 10)),
+    (hex2bytes("01 01"), date(2000, 1, 1)),
+)
+
+_TIME_CASES = (
+    (hex2bytes("1E 0A"), time(10, 30)),
+    (hex2bytes("1E 0A 2D"), time(10, 30, 45)),
+)
+
+_DATETIME_CASES = (
+    (hex2bytes("1E 0A 6A 28"), datetime(2019, 8, 10, 10, 30)),
+    (hex2bytes("1E 0A 6A 28 2D"), datetime(2019, 8, 10, 10, 30, 45)),
+)
+
+_DATETIME_FRAME_CASES = (
+    (b"", _DECODE_ERROR),
+    (hex2bytes("1E 0A 6A"), _DECODE_ERROR),
+    (hex2bytes("1E 0A 6A 28 2D 00"), _DECODE_ERROR),
+    (hex2bytes("1E 0A 6A 28"), _OK),
+)
+
+_BATCH_FRAMING_CASES = (
+    (hex2bytes("1E 0A 6A 28" * 2), 4, _OK),
+    (hex2bytes("1E 0A 6A 28 2D"), 4, _DECODE_ERROR),
+    (hex2bytes("1E 0A 6A"), 3, _DECODE_ERROR),
+)
+
+
+@pytest.mark.parametrize(
+    ("lsp", "msp", "answer"),
+    [
+        (0x00, 0x00, 2000),
+        (0x6A, 0x28, 2019),
+        (0xE0, 0xF0, 2027),  # raw year 127 -> 1900 + 127
+    ],
+)
+def test_get_year(lsp: int, msp: int, answer: int):
+    assert get_year(lsp, msp) == answer
+
+
+@pytest.mark.parametrize(("bindata", "answer"), _DATE_CASES)
+def test_date_parsing(bindata: bytes, answer: date):
+    assert get_date(bindata) == answer
+    assert parse_date(bindata) == answer
+
+
+@pytest.mark.parametrize(("bindata", "answer"), _TIME_CASES)
+def test_time_parsing(bindata: bytes, answer: time):
+    assert get_time(bindata) == answer
+    assert parse_time(bindata) == answer
+
+
+@pytest.mark.parametrize(("bindata", "answer"), _DATETIME_CASES)
+def test_datetime_parsing(bindata: bytes, answer: datetime):
+    assert get_datetime(bindata) == answer
+    assert parse_datetime(bindata) == answer
+
+
+@pytest.mark.parametrize(("bindata", "expectation"), _DATETIME_FRAME_CASES)
+def test_datetime_parsing_invalid_frame_length(bindata: bytes, expectation):
+    with expectation:
+        get_datetime(bindata)
+
+
+def test_get_datetimes_batch():
+    buf = hex2bytes("1E 0A 6A 28 2D" * 3)
+
+    answer = [datetime(2019, 8, 10, 10, 30, 45)] * 3
+
+    assert get_datetimes(buf) == answer
+
+
+@pytest.mark.parametrize(
+    ("buf", "frame_size", "expectation"), _BATCH_FRAMING_CASES
+)
+def test_get_datetimes_batch_framing(buf: bytes, frame_size: int, expectation):
+    with expectation:
+        get_datetimes(buf, frame_size=frame_size)
+
+
+def test_date_class():
+    obj = Date.from_hexstring("6A 28")
+
+    assert obj.date == date(2019, 8, 10)
+    assert obj == Date.from_integers([0x6A, 0x28])
+    assert obj == date(2019, 8, 10)
+    assert obj.to_iso_format() == "2019-08-10"
+
+
+def test_time_class():
+    obj = Time.from_bytearray(bytearray([0x1E, 0x0A]))
+
+    assert obj.time == time(10, 30)
+    assert obj == time(10, 30)
+    assert obj.to_hhmm_format() == "10:30"
+    assert obj.to_hhmmss_format() == "10:30:00"
+
+
+def test_datetime_class():
+    obj = DateTime.from_hexstring("1E 0A 6A 28")
+
+    assert obj.datetime == datetime(2019, 8, 10, 10, 30)
+    assert obj == datetime(2019, 8, 10, 10, 30)
+    assert obj.to_iso_format() == "2019-08-10T10:30:00"
+
+
+def test_hexstring_constructors_are_memoized():
+    assert Date.from_hexstring("6A 28") is Date.from_hexstring("6A 28")
+    assert DateTime.from_hexstring("1E 0A 6A 28") is DateTime.from_hexstring(
+        "1E 0A 6A 28"
+    )
+
+
+def test_datetime_class_is_lazy():
+    obj = DateTime.from_integers([0x1E, 0x0A, 0x6A, 0x28])
+
+    assert obj._datetime is None
+    assert obj == DateTime.from_integers([0x1E, 0x0A, 0x6A, 0x28])
+    assert obj._datetime is None
+
+    assert obj.datetime == datetime(2019, 8, 10, 10, 30)
+    assert obj._datetime is not None
+
+
+def test_value_classes_tuple_equality_and_hash():
+    obj = DateTime.from_integers([0x1E, 0x0A, 0x6A, 0x28])
+
+    assert obj == (2019, 8, 10, 10, 30, 0)
+    assert obj != (2019, 8, 10)
+    assert Date.from_hexstring("6A 28") == (2019, 8, 10)
+    assert len({obj, DateTime.from_integers([0x1E, 0x0A, 0x6A, 0x28])}) == 1
+
+
+def test_datetime_class_field_properties():
+    obj = DateTime.from_hexstring("1E 0A 6A 28 2D")
+
+    assert (obj.year, obj.month, obj.day) == (2019, 8, 10)
+    assert (obj.hour, obj.minute, obj.second) == (10, 30, 45)
+
+
+def test_datetime_decode_many():
+    buf = hex2bytes("1E 0A 6A 28 2D" * 3)
+
+    objs = DateTime.decode_many(buf)
+
+    assert objs == [DateTime.from_hexstring("1E 0A 6A 28 2D")] * 3
+    assert all(obj._datetime is None for obj in objs)
+
+    with _DECODE_ERROR:
+        DateTime.decode_many(buf[:3])